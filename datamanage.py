@@ -1,16 +1,72 @@
 import os
+import re
+import gzip
 import sys
 import json
-import csv
+import hashlib
 import numpy as np
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QLabel, QPushButton, QFileDialog, QMessageBox, QGroupBox, QGridLayout)
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QSettings
 from PyQt5.QtGui import QFont, QIcon, QKeyEvent
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from collections import deque
+from functools import lru_cache
+
+# Numeric columns read from each recording, in plotting order
+DATA_COLUMNS = ('timestamp', 'acc_x', 'acc_y', 'acc_z', 'gyro_x', 'gyro_y', 'gyro_z')
+
+# Recording filenames: <letter>_<user_id>_<hand>_<date>_<time>.csv (or .csv.gz)
+FILENAME_PATTERN = re.compile(
+    r'^(?P<letter>[^_]*)(?:_(?P<user_id>[^_]*))?(?:_(?P<hand>[^_]*))?(?:_(?P<date>[^_.]*))?'
+)
+
+# Number of folders whose file listings are remembered between sessions
+LISTING_CACHE_SIZE = 5
+
+@lru_cache(maxsize=32)
+def load_recording(file_path, mtime):
+    """Read a recording's numeric columns, cached until its mtime changes"""
+    opener = gzip.open if file_path.lower().endswith('.gz') else open
+    with opener(file_path, 'rt', encoding='utf-8') as f:
+        header = f.readline().strip().split(',')
+        usecols = [header.index(col) for col in DATA_COLUMNS]
+        data = np.loadtxt(
+            f, delimiter=',', usecols=usecols, dtype=np.float32, ndmin=2
+        ).reshape(-1, len(DATA_COLUMNS))
+    
+    # Cached arrays are shared between calls, so keep them read-only
+    data.flags.writeable = False
+    return data
+
+def find_csv_files(folder, dir_mtimes=None):
+    """Yield CSV (and gzipped CSV) file paths under folder, using cached DirEntry types"""
+    try:
+        mtime = os.stat(folder).st_mtime
+        with os.scandir(folder) as entries:
+            subdirs = []
+            files = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.lower().endswith(('.csv', '.csv.gz')):
+                    files.append(entry.path)
+    except OSError:
+        # Unreadable directory (locked, system folder); skip it like os.walk does,
+        # but mark it so a listing missing its files is never cached
+        if dir_mtimes is not None:
+            dir_mtimes[folder] = None
+        return
+    
+    # Optionally record each visited directory's mtime for cache validation
+    if dir_mtimes is not None:
+        dir_mtimes[folder] = mtime
+    
+    yield from files
+    for subdir in subdirs:
+        yield from find_csv_files(subdir, dir_mtimes)
 
 class DataVisualizer(FigureCanvas):
     """Canvas for plotting accelerometer and gyroscope data"""
@@ -51,27 +107,18 @@ class DataVisualizer(FigureCanvas):
     
     def plot_data(self, data):
         """Plot the loaded data"""
-        timestamps = [point['timestamp'] for point in data]
+        # data is an (N, 7) array: timestamp, acc_x/y/z, gyro_x/y/z
+        # Thin out traces that have more samples than the canvas has pixels
+        max_points = max(2 * self.width() * self.devicePixelRatio(), 2000)
+        if data.shape[0] > max_points:
+            data = data[::-(-data.shape[0] // max_points)]
         
-        # Extract accelerometer data
-        acc_x = [point['acc_x'] for point in data]
-        acc_y = [point['acc_y'] for point in data]
-        acc_z = [point['acc_z'] for point in data]
+        timestamps = data[:, 0]
         
-        # Extract gyroscope data
-        gyro_x = [point['gyro_x'] for point in data]
-        gyro_y = [point['gyro_y'] for point in data]
-        gyro_z = [point['gyro_z'] for point in data]
-        
-        # Update accelerometer plot
-        self.accel_lines[0].set_data(timestamps, acc_x)
-        self.accel_lines[1].set_data(timestamps, acc_y)
-        self.accel_lines[2].set_data(timestamps, acc_z)
-        
-        # Update gyroscope plot
-        self.gyro_lines[0].set_data(timestamps, gyro_x)
-        self.gyro_lines[1].set_data(timestamps, gyro_y)
-        self.gyro_lines[2].set_data(timestamps, gyro_z)
+        # Update accelerometer and gyroscope plots from column views
+        for i in range(3):
+            self.accel_lines[i].set_data(timestamps, data[:, 1 + i])
+            self.gyro_lines[i].set_data(timestamps, data[:, 4 + i])
         
         # Adjust axes
         self.accel_ax.relim()
@@ -79,7 +126,8 @@ class DataVisualizer(FigureCanvas):
         self.gyro_ax.relim()
         self.gyro_ax.autoscale_view()
         
-        self.draw()
+        # Let Qt coalesce redraws when arrowing quickly through files
+        self.draw_idle()
 
 class DataExplorer(QMainWindow):
     """Main application window for exploring recorded data"""
@@ -91,8 +139,10 @@ class DataExplorer(QMainWindow):
         # Data variables
         self.current_folder = ""
         self.data_files = []
+        self.dir_mtimes = {}
+        self.settings = QSettings("AirWriting", "DataExplorer")
         self.current_index = -1
-        self.current_data = []
+        self.current_data = np.empty((0, len(DATA_COLUMNS)), dtype=np.float32)
         self.metadata = {}
         
         # UI Setup
@@ -227,11 +277,7 @@ class DataExplorer(QMainWindow):
             self.folder_label.setText(f"Folder: {folder}")
             
             # Find all CSV files in the folder and subfolders
-            self.data_files = []
-            for root, _, files in os.walk(folder):
-                for file in files:
-                    if file.lower().endswith('.csv'):
-                        self.data_files.append(os.path.join(root, file))
+            self.data_files = self.list_data_files(folder)
             
             if self.data_files:
                 self.current_index = 0
@@ -241,28 +287,65 @@ class DataExplorer(QMainWindow):
                 self.clear_display()
                 QMessageBox.information(self, "No Files", "No CSV files found in the selected folder")
     
+    def list_data_files(self, folder):
+        """List CSV files under folder, reusing the cached listing if no directory changed"""
+        try:
+            cached = json.loads(self.settings.value(self.listing_key(folder), "null"))
+            if cached and cached['folder'] == folder and folder in cached['dirs']:
+                if all(os.stat(d).st_mtime == mtime for d, mtime in cached['dirs'].items()):
+                    self.dir_mtimes = cached['dirs']
+                    return cached['files']
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass  # A cached directory is gone or the cached value is corrupt, rescan
+        
+        self.dir_mtimes = {}
+        files = list(find_csv_files(folder, self.dir_mtimes))
+        self.save_listing(folder, files)
+        return files
+    
+    def listing_key(self, folder):
+        """Settings key holding one folder's cached listing"""
+        return "listings/" + hashlib.sha1(folder.encode('utf-8')).hexdigest()
+    
+    def save_listing(self, folder, files):
+        """Persist the folder's file listing with its directory mtimes"""
+        key = self.listing_key(folder)
+        if None in self.dir_mtimes.values():
+            self.settings.remove(key)  # The scan skipped an unreadable directory; rescan next time
+            return
+        self.settings.setValue(key, json.dumps({'folder': folder, 'dirs': self.dir_mtimes, 'files': files}))
+        
+        # Remember only the most recently listed folders
+        try:
+            recent = [k for k in json.loads(self.settings.value("recent_listings", "[]"))
+                      if isinstance(k, str) and k != key]
+        except (ValueError, TypeError):
+            recent = []
+        recent.insert(0, key)
+        for stale in recent[LISTING_CACHE_SIZE:]:
+            self.settings.remove(stale)
+        self.settings.setValue("recent_listings", json.dumps(recent[:LISTING_CACHE_SIZE]))
+    
     def load_current_file(self):
         """Load the current file's data"""
         if 0 <= self.current_index < len(self.data_files):
             file_path = self.data_files[self.current_index]
             
             try:
-                # Read CSV file
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    self.current_data = [row for row in reader]
+                # Read CSV file (cached until the file changes)
+                self.current_data = load_recording(file_path, os.path.getmtime(file_path))
                 
                 # Extract metadata from filename
                 filename = os.path.basename(file_path)
-                parts = filename.split('_')
+                fields = FILENAME_PATTERN.match(filename).groupdict("Unknown")
                 
                 self.metadata = {
-                    'letter': parts[0] if len(parts) > 0 else "Unknown",
-                    'user_id': parts[1] if len(parts) > 1 else "Unknown",
-                    'hand': parts[2] if len(parts) > 2 else "Unknown",
-                    'date': parts[3].split('.')[0] if len(parts) > 3 else "Unknown",
-                    'duration': float(self.current_data[-1]['timestamp']) if self.current_data else 0,
-                    'samples': len(self.current_data)
+                    'letter': fields['letter'],
+                    'user_id': fields['user_id'],
+                    'hand': fields['hand'],
+                    'date': fields['date'],
+                    'duration': float(self.current_data[-1, 0]) if len(self.current_data) else 0,
+                    'samples': self.current_data.shape[0]
                 }
                 
                 # Update UI
@@ -282,21 +365,8 @@ class DataExplorer(QMainWindow):
         self.meta_labels['duration'].setText(f"Duration: {self.metadata['duration']:.2f}s")
         self.meta_labels['samples'].setText(f"Samples: {self.metadata['samples']}")
         
-        # Convert data to numeric format for plotting
-        numeric_data = []
-        for point in self.current_data:
-            numeric_data.append({
-                'timestamp': float(point['timestamp']),
-                'acc_x': float(point['acc_x']),
-                'acc_y': float(point['acc_y']),
-                'acc_z': float(point['acc_z']),
-                'gyro_x': float(point['gyro_x']),
-                'gyro_y': float(point['gyro_y']),
-                'gyro_z': float(point['gyro_z'])
-            })
-        
         # Update visualization
-        self.visualizer.plot_data(numeric_data)
+        self.visualizer.plot_data(self.current_data)
         
         # Update navigation buttons
         self.prev_button.setEnabled(self.current_index > 0)
@@ -311,7 +381,7 @@ class DataExplorer(QMainWindow):
         # Clear plots
         for line in self.visualizer.accel_lines + self.visualizer.gyro_lines:
             line.set_data([], [])
-        self.visualizer.draw()
+        self.visualizer.draw_idle()
         
         self.delete_button.setEnabled(False)
     
@@ -341,9 +411,14 @@ class DataExplorer(QMainWindow):
             if reply == QMessageBox.Yes:
                 try:
                     os.remove(file_path)
+                    load_recording.cache_clear()
                     
-                    # Remove from file list
+                    # Remove from file list and keep the cached listing in sync
                     del self.data_files[self.current_index]
+                    file_dir = os.path.dirname(file_path)
+                    if file_dir in self.dir_mtimes:
+                        self.dir_mtimes[file_dir] = os.stat(file_dir).st_mtime
+                        self.save_listing(self.current_folder, self.data_files)
                     
                     # Adjust current index
                     if self.current_index >= len(self.data_files):
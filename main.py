@@ -18,29 +18,66 @@ from matplotlib.figure import Figure
 # Configuration Constants
 DATA_DIR = "recordings"
 GITHUB_REPO_PATH = "git@github.com:zubayertahmid/air-writing-data.git"  # Update this with your GitHub repo path
-BENGALI_ALPHABETS = ["অ", "আ", "ই", "ঈ", "উ", "ঊ", "ঋ", "এ", "ঐ", "ও", "ঔ", 
+BENGALI_ALPHABETS = ("অ", "আ", "ই", "ঈ", "উ", "ঊ", "ঋ", "এ", "ঐ", "ও", "ঔ", 
                     "ক", "খ", "গ", "ঘ", "ঙ", "চ", "ছ", "জ", "ঝ", "ঞ", 
                     "ট", "ঠ", "ড", "ঢ", "ণ", "ত", "থ", "দ", "ধ", "ন", 
                     "প", "ফ", "ব", "ভ", "ম", "য", "র", "ল", "শ", "ষ", 
-                    "স", "হ", "ড়", "ঢ়", "য়", "ৎ", "ং", "ঃ", "ঁ"]
+                    "স", "হ", "ড়", "ঢ়", "য়", "ৎ", "ং", "ঃ", "ঁ")
 BUFFER_SIZE = 100  # Number of data points to display in the graphg
 SERIAL_BAUD_RATE = 115200
+SERIAL_READ_TIMEOUT = 0.1  # Seconds a blocking read waits before rechecking for shutdown
+SERIAL_RX_BUFFER_SIZE = 65536  # Driver receive buffer in bytes (Windows only)
+MAX_RECORDING_SAMPLES = 600000  # Rows preallocated per recording (10 min at 1 kHz); recording stops when full
+WRITE_BUFFER_SIZE = 1 << 20  # Bytes buffered before a recording is written to disk
+GIT_SYNC_INTERVAL = 30000  # Milliseconds between batched GitHub syncs of saved recordings
+
+def parse_samples(lines):
+    """Parse raw 'v1,...,v7' byte lines into an (N, 7) float array"""
+    # Tolerate surrounding whitespace and trailing commas, as float-per-field parsing did
+    lines = [line for line in (line.strip().rstrip(b',') for line in lines) if line]
+    if not lines:
+        return np.empty((0, 7))
+    
+    if all(line.count(b',') == 6 for line in lines):
+        try:
+            # Convert every field of the batch in a single NumPy call
+            return np.array(b','.join(lines).split(b','), dtype=np.float64).reshape(-1, 7)
+        except ValueError:
+            pass  # A garbled line somewhere in the batch
+    
+    # Fall back to line by line: drop empty fields, skip lines that are garbled
+    # or do not hold all 7 expected values
+    rows = []
+    for line in lines:
+        try:
+            row = np.array([x for x in line.split(b',') if x], dtype=np.float64)
+        except ValueError:
+            continue
+        if row.shape == (7,):
+            rows.append(row)
+    return np.array(rows).reshape(-1, 7)
 
 class SerialThread(QThread):
-    data_received = pyqtSignal(list)
+    data_received = pyqtSignal(object)  # (N, 7) array of samples
     connection_status = pyqtSignal(bool, str)
     
     def __init__(self):
         super().__init__()
         self.serial_port = None
-        self.running = False
+        self.stop_event = threading.Event()
         self.port_name = None
 
     def connect_to_device(self, port_name):
         try:
             self.port_name = port_name
-            self.serial_port = serial.Serial(port_name, SERIAL_BAUD_RATE, timeout=1)
-            self.running = True
+            self.serial_port = serial.Serial(port_name, SERIAL_BAUD_RATE, timeout=SERIAL_READ_TIMEOUT,
+                                             xonxoff=False)
+            # Larger driver-side receive buffer where supported (Windows only)
+            if hasattr(self.serial_port, 'set_buffer_size'):
+                self.serial_port.set_buffer_size(rx_size=SERIAL_RX_BUFFER_SIZE, tx_size=4096)
+            # Drop anything queued before we connected, including partial lines
+            self.serial_port.reset_input_buffer()
+            self.stop_event.clear()
             self.connection_status.emit(True, f"Connected to {port_name}")
             return True
         except Exception as e:
@@ -49,24 +86,34 @@ class SerialThread(QThread):
 
     def disconnect_device(self):
         if self.serial_port and self.serial_port.is_open:
-            self.running = False
+            # Wake the blocked read and let the thread exit before closing the port
+            self.stop_event.set()
+            if hasattr(self.serial_port, 'cancel_read'):
+                self.serial_port.cancel_read()
+            self.wait()
             self.serial_port.close()
             self.serial_port = None
             self.connection_status.emit(False, "Disconnected")
 
     def run(self):
-        while self.running:
+        pending = b''  # Trailing partial line from the previous read
+        while not self.stop_event.is_set():
             try:
-                if self.serial_port and self.serial_port.in_waiting:
-                    line = self.serial_port.readline().decode('utf-8').strip()
-                    data = [float(x) for x in line.split(',') if x]
-                    if len(data) == 7:  # Ensure we have all 7 expected values
-                        self.data_received.emit(data)
-                time.sleep(0.01)  # Small delay to prevent CPU hogging
+                # Block until at least one byte arrives (or the timeout passes),
+                # then drain everything waiting and emit the complete lines as one batch
+                chunk = self.serial_port.read(max(1, self.serial_port.in_waiting))
+                if not chunk:
+                    continue
+                pending += chunk
+                *lines, pending = pending.split(b'\n')
+                batch = parse_samples(lines)
+                if len(batch):
+                    self.data_received.emit(batch)
             except Exception as e:
+                if self.stop_event.is_set():
+                    break  # Read interrupted by disconnect
                 print(f"Serial read error: {str(e)}")
                 self.connection_status.emit(False, f"Error: {str(e)}")
-                self.running = False
                 break
 
 class DataGraph(FigureCanvas):
@@ -78,26 +125,33 @@ class DataGraph(FigureCanvas):
         
         # Data storage for plotting
         self.times = np.linspace(0, BUFFER_SIZE-1, BUFFER_SIZE)
-        self.acc_x = np.zeros(BUFFER_SIZE)
-        self.acc_y = np.zeros(BUFFER_SIZE)
-        self.acc_z = np.zeros(BUFFER_SIZE)
-        self.gyro_x = np.zeros(BUFFER_SIZE)
-        self.gyro_y = np.zeros(BUFFER_SIZE)
-        self.gyro_z = np.zeros(BUFFER_SIZE)
+        # Ring buffer of acc_x/y/z, gyro_x/y/z rows; head is the oldest slot.
+        # Every row is written twice, BUFFER_SIZE apart, so the ordered window
+        # is always the contiguous slice samples[head:head + BUFFER_SIZE]
+        self.samples = np.zeros((2 * BUFFER_SIZE, 6), dtype=np.float32)
+        self.head = 0
+        self.stride = 1  # Plot every stride-th sample so points never exceed canvas width
+        self.dirty = False  # Set when samples arrived since the last refresh
         
         self.acc_lines = None
         self.gyro_lines = None
         
+        # Static background (axes, grid, legend) cached for blitting
+        self.background = None
+        self.mpl_connect('draw_event', self.on_draw)
+        
         self.setup_plot()
         
     def setup_plot(self):
         self.axes.clear()
-        self.acc_lines, = self.axes.plot(self.times, self.acc_x, 'r-', label='Acc X')
-        self.acc_liney, = self.axes.plot(self.times, self.acc_y, 'g-', label='Acc Y')
-        self.acc_linez, = self.axes.plot(self.times, self.acc_z, 'b-', label='Acc Z')
-        self.gyro_linex, = self.axes.plot(self.times, self.gyro_x, 'r--', label='Gyro X')
-        self.gyro_liney, = self.axes.plot(self.times, self.gyro_y, 'g--', label='Gyro Y')
-        self.gyro_linez, = self.axes.plot(self.times, self.gyro_z, 'b--', label='Gyro Z')
+        self.acc_lines, = self.axes.plot(self.times, self.samples[:BUFFER_SIZE, 0], 'r-', label='Acc X')
+        self.acc_liney, = self.axes.plot(self.times, self.samples[:BUFFER_SIZE, 1], 'g-', label='Acc Y')
+        self.acc_linez, = self.axes.plot(self.times, self.samples[:BUFFER_SIZE, 2], 'b-', label='Acc Z')
+        self.gyro_linex, = self.axes.plot(self.times, self.samples[:BUFFER_SIZE, 3], 'r--', label='Gyro X')
+        self.gyro_liney, = self.axes.plot(self.times, self.samples[:BUFFER_SIZE, 4], 'g--', label='Gyro Y')
+        self.gyro_linez, = self.axes.plot(self.times, self.samples[:BUFFER_SIZE, 5], 'b--', label='Gyro Z')
+        self.lines = [self.acc_lines, self.acc_liney, self.acc_linez,
+                      self.gyro_linex, self.gyro_liney, self.gyro_linez]
         
         self.axes.set_ylim(-20, 20)  # Adjust based on your sensor range
         self.axes.set_xlabel('Time')
@@ -106,112 +160,227 @@ class DataGraph(FigureCanvas):
         self.axes.grid(True)
         self.fig.tight_layout()
         
+        # Lines are drawn by blitting only, so full draws render just the background
+        for line in self.lines:
+            line.set_animated(True)
+        
+    def on_draw(self, event):
+        # A full draw happened (first show, resize): re-cache the background
+        self.background = self.copy_from_bbox(self.axes.bbox)
+        for line in self.lines:
+            self.axes.draw_artist(line)
+        
     def update_data(self, new_data):
-        # Shift data arrays and add new values
-        self.acc_x = np.roll(self.acc_x, -1)
-        self.acc_y = np.roll(self.acc_y, -1)
-        self.acc_z = np.roll(self.acc_z, -1)
-        self.gyro_x = np.roll(self.gyro_x, -1)
-        self.gyro_y = np.roll(self.gyro_y, -1)
-        self.gyro_z = np.roll(self.gyro_z, -1)
-        
-        self.acc_x[-1] = new_data[0]
-        self.acc_y[-1] = new_data[1]
-        self.acc_z[-1] = new_data[2]
-        self.gyro_x[-1] = new_data[3]
-        self.gyro_y[-1] = new_data[4]
-        self.gyro_z[-1] = new_data[5]
-        
-        # Update the plot
-        self.acc_lines.set_ydata(self.acc_x)
-        self.acc_liney.set_ydata(self.acc_y)
-        self.acc_linez.set_ydata(self.acc_z)
-        self.gyro_linex.set_ydata(self.gyro_x)
-        self.gyro_liney.set_ydata(self.gyro_y)
-        self.gyro_linez.set_ydata(self.gyro_z)
-        
-        self.draw()
+        # Overwrite the oldest samples with the new batch; nothing is shifted
+        batch = new_data[-BUFFER_SIZE:, :6]
+        slots = (self.head + np.arange(len(batch))) % BUFFER_SIZE
+        self.samples[slots] = batch
+        self.samples[slots + BUFFER_SIZE] = batch
+        self.head = (self.head + len(batch)) % BUFFER_SIZE
+        self.dirty = True
+    
+    def ordered_samples(self):
+        # Ring buffer contents in oldest-to-newest order, as a view (no copy)
+        return self.samples[self.head:self.head + BUFFER_SIZE]
+    
+    def resizeEvent(self, event):
+        stride = max(1, BUFFER_SIZE // max(1, event.size().width()))
+        if stride != self.stride:
+            self.stride = stride
+            times = self.times[::stride]
+            view = self.ordered_samples()[::stride]
+            for i, line in enumerate(self.lines):
+                line.set_data(times, view[:, i])
+        super().resizeEvent(event)
+    
+    def refresh(self):
+        # Nothing new to show since the last tick
+        if not self.dirty:
+            return
+        self.dirty = False
+        
+        # Update the plot in oldest-to-newest order; xdata only changes on resize
+        view = self.ordered_samples()[::self.stride]
+        for i, line in enumerate(self.lines):
+            line.set_ydata(view[:, i])
+        
+        if self.background is None:
+            self.draw_idle()
+            return
+        
+        # Repaint only the lines over the cached background
+        self.restore_region(self.background)
+        for line in self.lines:
+            self.axes.draw_artist(line)
+        self.blit(self.axes.bbox)
 
 class DataRecorder:
     def __init__(self):
         self.recording = False
-        self.data_buffer = []
+        # Per-sample timestamps (float64, so long recordings keep microsecond
+        # resolution) and rows of the 6 saved sensor values (x7 is ignored);
+        # only the first sample_count are valid
+        self.timestamps = np.empty(0)
+        self.data_buffer = np.empty((0, 6), dtype=np.float32)
+        self.sample_count = 0
         self.start_time = None
+        self.last_timestamp = 0.0  # Timestamp of the newest recorded sample
         self.user_id = None
         self.alphabet = None
         self.hand_preference = None
         
+        # Saved files waiting for the next batched GitHub sync
+        self.repo = None
+        self.pending_files = []
+        self.pending_lock = threading.Lock()
+        self.unpushed = False
+        
     def start_recording(self, user_id, alphabet, hand_preference):
         self.recording = True
-        self.data_buffer = []
-        self.start_time = time.time()
+        # Allocate once up front so recording itself never allocates
+        self.timestamps = np.empty(MAX_RECORDING_SAMPLES)
+        self.data_buffer = np.empty((MAX_RECORDING_SAMPLES, 6), dtype=np.float32)
+        self.sample_count = 0
+        self.start_time = time.perf_counter()  # Monotonic, so timestamps never step back
+        self.last_timestamp = 0.0
         self.user_id = user_id
         self.alphabet = alphabet
         self.hand_preference = hand_preference
         
     def add_data(self, data):
         if self.recording:
-            timestamp = time.time() - self.start_time
-            self.data_buffer.append([timestamp] + data)
+            # A batch is everything that arrived since the previous one, so spread
+            # its timestamps evenly over that interval; keep them strictly
+            # increasing (1 us apart at least) even if the clock has not moved
+            now = max(time.perf_counter() - self.start_time, self.last_timestamp + 1e-6 * len(data))
+            timestamps = np.linspace(self.last_timestamp, now, len(data) + 1)[1:]
+            self.last_timestamp = now
+            
+            # Store what fits; the caller stops the recording once the buffer is full
+            end = min(self.sample_count + len(data), MAX_RECORDING_SAMPLES)
+            
+            self.timestamps[self.sample_count:end] = timestamps[:end - self.sample_count]
+            self.data_buffer[self.sample_count:end] = data[:end - self.sample_count, :6]
+            self.sample_count = end
+        return self.sample_count < MAX_RECORDING_SAMPLES
     
     def stop_recording(self):
         self.recording = False
-        return len(self.data_buffer) > 0
+        return self.sample_count > 0
+    
+    def take_recording(self):
+        # Hand the recorded rows over for saving; the next recording allocates
+        # a fresh buffer, so it can begin while this one is written
+        timestamps = self.timestamps[:self.sample_count]
+        samples = self.data_buffer[:self.sample_count]
+        self.timestamps = np.empty(0)
+        self.data_buffer = np.empty((0, 6), dtype=np.float32)
+        self.sample_count = 0
+        return timestamps, samples, self.user_id, self.alphabet, self.hand_preference
     
-    def save_data(self):
-        if not self.data_buffer:
+    def save_data(self, timestamps, samples, user_id, alphabet, hand_preference):
+        if not len(samples):
             return False
         
         # Create directory structure if it doesn't exist
-        alphabet_dir = os.path.join(DATA_DIR, self.alphabet)
+        alphabet_dir = os.path.join(DATA_DIR, alphabet)
         os.makedirs(alphabet_dir, exist_ok=True)
         
         # Generate unique filename with timestamp
         timestamp = time.strftime("%Y%m%d_%H%M%S")
-        filename = f"{self.alphabet}_{self.user_id}_{self.hand_preference}_{timestamp}.csv"
+        filename = f"{alphabet}_{user_id}_{hand_preference}_{timestamp}.csv"
         filepath = os.path.join(alphabet_dir, filename)
         
-        # Write data to CSV
-        with open(filepath, 'w', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-            # Write header
-            writer.writerow(['timestamp', 'user_id', 'hand_preference', 'acc_x', 'acc_y', 'acc_z', 'gyro_x', 'gyro_y', 'gyro_z'])
+        # Write data to CSV in one pass; user ID and hand are constant, so they
+        # are baked into the row format instead of stored per row
+        header = 'timestamp,user_id,hand_preference,acc_x,acc_y,acc_z,gyro_x,gyro_y,gyro_z'
+        constants = f"{user_id},{hand_preference}".replace('%', '%%')
+        row_format = '%.6f,' + constants + ',%.6g,%.6g,%.6g,%.6g,%.6g,%.6g'
+        with open(filepath, 'w', newline='', buffering=WRITE_BUFFER_SIZE) as csvfile:
+            np.savetxt(csvfile, np.column_stack((timestamps, samples)), fmt=row_format,
+                       header=header, comments='')
             
-            # Write data rows
-            for row in self.data_buffer:
-                timestamp, acc_x, acc_y, acc_z, gyro_x, gyro_y, gyro_z, _ = row  # Ignore x7
-                writer.writerow([timestamp, self.user_id, self.hand_preference, acc_x, acc_y, acc_z, gyro_x, gyro_y, gyro_z])
+            # Make sure the recording is on disk once, before it is committed
+            csvfile.flush()
+            os.fsync(csvfile.fileno())
+        
+        # Queue for the next GitHub sync
+        with self.pending_lock:
+            self.pending_files.append((filepath, f"Added new recording: User ID {user_id}, Alphabet {alphabet}, {hand_preference} Hand"))
+        return True
+    
+    def sync_with_github(self):
+        # Commit every queued recording at once and push, reusing one repo handle
+        with self.pending_lock:
+            batch, self.pending_files = self.pending_files, []
+        if not batch and not self.unpushed:
+            return True
         
-        # Sync with GitHub
         try:
-            self.sync_with_github(filepath, f"Added new recording: User ID {self.user_id}, Alphabet {self.alphabet}, {self.hand_preference} Hand")
-            return True
+            if self.repo is None:
+                self.repo = git.Repo(GITHUB_REPO_PATH)
+            
+            if batch:
+                relative_paths = [os.path.relpath(filepath, GITHUB_REPO_PATH) for filepath, _ in batch]
+                self.repo.git.add(*relative_paths)
+                
+                messages = [message for _, message in batch]
+                if len(messages) == 1:
+                    self.repo.git.commit('-m', messages[0])
+                else:
+                    self.repo.git.commit('-m', f"Added {len(messages)} new recordings", '-m', "\n".join(messages))
+                self.unpushed = True
         except Exception as e:
             print(f"GitHub sync error: {str(e)}")
+            # Keep the files queued for the next attempt
+            with self.pending_lock:
+                self.pending_files[:0] = batch
             return False
-    
-    def sync_with_github(self, filepath, commit_message):
+        
         try:
-            repo = git.Repo(GITHUB_REPO_PATH)
-            
-            # Check if the file is already being tracked
-            relative_path = os.path.relpath(filepath, GITHUB_REPO_PATH)
-            repo.git.add(relative_path)
-            
-            # Commit and push
-            repo.git.commit('-m', commit_message)
-            origin = repo.remote(name='origin')
+            origin = self.repo.remote(name='origin')
             origin.push()
-            
+            self.unpushed = False
             return True
         except Exception as e:
             print(f"GitHub sync error: {str(e)}")
-            raise e
+            return False
+
+class SaveSignals(QtCore.QObject):
+    finished = pyqtSignal(bool)
+
+class SaveTask(QtCore.QRunnable):
+    """Writes and syncs a finished recording on a worker thread"""
+    def __init__(self, data_recorder, signals, recording):
+        super().__init__()
+        self.data_recorder = data_recorder
+        self.signals = signals
+        self.recording = recording
+    
+    def run(self):
+        try:
+            success = self.data_recorder.save_data(*self.recording)
+        except Exception as e:
+            print(f"Save error: {str(e)}")
+            success = False
+        self.signals.finished.emit(success)
+
+class SyncTask(QtCore.QRunnable):
+    """Commits and pushes queued recordings on a worker thread"""
+    def __init__(self, data_recorder):
+        super().__init__()
+        self.data_recorder = data_recorder
+    
+    def run(self):
+        self.data_recorder.sync_with_github()
 
 class UserManager:
     def __init__(self):
         self.users_file = os.path.join(DATA_DIR, "users.csv")
         self.users = {}
+        self.needs_header = True
+        self.users_handle = None  # Opened on first registration, kept for the session
+        self.users_writer = None
         self.load_users()
         
     def load_users(self):
@@ -221,10 +390,9 @@ class UserManager:
             with open(self.users_file, 'r') as csvfile:
                 reader = csv.reader(csvfile)
                 next(reader, None)  # Skip header
-                for row in reader:
-                    if len(row) >= 2:
-                        user_id, username = row[0], row[1]
-                        self.users[username] = user_id
+                self.users = {row[1]: row[0] for row in reader if len(row) >= 2}
+        
+        self.needs_header = not os.path.exists(self.users_file) or os.path.getsize(self.users_file) == 0
     
     def register_user(self, username):
         if username in self.users:
@@ -235,14 +403,21 @@ class UserManager:
         self.users[username] = user_id
         
         # Save to file
-        with open(self.users_file, 'a', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-            if os.path.getsize(self.users_file) == 0:
-                writer.writerow(['user_id', 'username'])
-            writer.writerow([user_id, username])
+        if self.users_handle is None:
+            self.users_handle = open(self.users_file, 'a', newline='', buffering=1)
+            self.users_writer = csv.writer(self.users_handle)
+        if self.needs_header:
+            self.users_writer.writerow(['user_id', 'username'])
+            self.needs_header = False
+        self.users_writer.writerow([user_id, username])
         
         return user_id
     
+    def close(self):
+        if self.users_handle is not None:
+            self.users_handle.close()
+            self.users_handle = None
+    
     def get_user_id(self, username):
         if username in self.users:
             return self.users[username]
@@ -265,6 +440,17 @@ class MainWindow(QtWidgets.QMainWindow):
         self.data_recorder = DataRecorder()
         self.user_manager = UserManager()
         
+        # Saves run one at a time off the UI thread so git operations never overlap
+        self.save_pool = QtCore.QThreadPool()
+        self.save_pool.setMaxThreadCount(1)
+        self.save_signals = SaveSignals()
+        self.save_signals.finished.connect(self.save_finished)
+        
+        # Push saved recordings to GitHub in batches rather than one by one
+        self.sync_timer = QTimer()
+        self.sync_timer.timeout.connect(self.sync_recordings)
+        self.sync_timer.start(GIT_SYNC_INTERVAL)
+        
         self.setup_ui()
         
         # Start with device detection
@@ -396,51 +582,70 @@ class MainWindow(QtWidgets.QMainWindow):
                 QtWidgets.QMessageBox.warning(self, "Recording Error", "Please register a user first")
                 return
             
-            alphabet = self.alphabet_combo.currentText()
+            alphabet = BENGALI_ALPHABETS[self.alphabet_combo.currentIndex()]
             hand = "Right" if self.hand_combo.currentText() == "Right Hand" else "Left"
             
             self.data_recorder.start_recording(user_id, alphabet, hand)
             self.record_button.setText("Stop Recording")
             self.recording_status.setText(f"Recording: {alphabet} - {hand} Hand")
         else:
-            # Stop recording
-            if self.data_recorder.stop_recording():
-                reply = QtWidgets.QMessageBox.question(
-                    self, "Save Recording", 
-                    "Do you want to save this recording?",
-                    QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No
-                )
-                
-                if reply == QtWidgets.QMessageBox.Yes:
-                    if self.data_recorder.save_data():
-                        QtWidgets.QMessageBox.information(
-                            self, "Success", 
-                            "Data saved and synchronized with GitHub"
-                        )
-                    else:
-                        QtWidgets.QMessageBox.warning(
-                            self, "Save Error", 
-                            "Failed to save data"
-                        )
+            self.finish_recording("Do you want to save this recording?")
+    
+    def finish_recording(self, prompt):
+        # Stop recording
+        if self.data_recorder.stop_recording():
+            reply = QtWidgets.QMessageBox.question(
+                self, "Save Recording", 
+                prompt,
+                QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No
+            )
             
-            self.record_button.setText("Start Recording")
-            self.recording_status.setText("Not recording")
+            if reply == QtWidgets.QMessageBox.Yes:
+                recording = self.data_recorder.take_recording()
+                self.save_pool.start(SaveTask(self.data_recorder, self.save_signals, recording))
+        
+        self.record_button.setText("Start Recording")
+        self.recording_status.setText("Not recording")
+    
+    def save_finished(self, success):
+        if success:
+            QtWidgets.QMessageBox.information(
+                self, "Success", 
+                "Data saved; it will be synchronized with GitHub shortly"
+            )
+        else:
+            QtWidgets.QMessageBox.warning(
+                self, "Save Error", 
+                "Failed to save data"
+            )
+    
+    def sync_recordings(self):
+        self.save_pool.start(SyncTask(self.data_recorder))
     
     def update_data(self, data):
         self.graph.update_data(data)
         
         if self.data_recorder.recording:
-            self.data_recorder.add_data(data)
+            if not self.data_recorder.add_data(data):
+                # Buffer full: stop now rather than silently dropping samples
+                self.finish_recording(f"The recording reached the limit of {MAX_RECORDING_SAMPLES} samples "
+                                      "and was stopped. Do you want to save it?")
     
     def update_ui(self):
-        # Periodic UI updates if needed
-        pass
+        # Redraw the graph at the timer rate rather than once per sample
+        self.graph.refresh()
     
     def closeEvent(self, event):
         # Clean up before closing
         if self.serial_thread.isRunning():
             self.serial_thread.disconnect_device()
             self.serial_thread.wait()
+        
+        # Let pending saves finish, then sync whatever is still queued
+        self.sync_timer.stop()
+        self.sync_recordings()
+        self.save_pool.waitForDone()
+        self.user_manager.close()
         event.accept()
 
 if __name__ == "__main__":
@@ -1,18 +1,20 @@
 import sys
 import json
+import gzip
+import logging
 import os
 import numpy as np
 import serial
 import serial.tools.list_ports
 import time
-from collections import deque
+import queue
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QLabel, QPushButton, QComboBox, QStatusBar, QMessageBox, 
                             QSplitter, QGroupBox, QGridLayout, QFrame, QLineEdit)
-from PyQt5.QtCore import QTimer, Qt, QThread, pyqtSignal
+from PyQt5.QtCore import QTimer, Qt, QThread, pyqtSignal, QMutex, QWaitCondition
 from PyQt5.QtGui import QFont, QIcon, QColor, QPalette
 import csv
 import uuid
@@ -30,10 +32,20 @@ COLORS = ["#2C3E50", "#E74C3C", "#3498DB", "#9B59B6", "#16A085", "#F39C12"]
 DATA_DIR = "recordings"
 GITHUB_REPO_PATH = "git@github.com:zubayertahmid/air-writing-data.git"  # Update with your repo
 HAND_PREFERENCES = ["Right Hand", "Left Hand"]
+UI_UPDATE_INTERVAL = 50  # Milliseconds between UI timer ticks (20 Hz)
+DISPLAY_SKIP_OPTIONS = [1, 2, 3, 5, 10]  # Redraw the plot every Nth UI tick
+DEFAULT_DISPLAY_SKIP = 3
+RECORDING_INITIAL_CAPACITY = 4096  # Rows preallocated for a recording; doubled when full
+GIT_SYNC_BATCH_SIZE = 10  # Saved recordings that trigger an immediate GitHub sync
+GIT_SYNC_INTERVAL = 60  # Seconds a saved recording may wait before it is synced anyway
+SERIAL_READ_TIMEOUT = 0.1  # Seconds a blocking read waits before rechecking for shutdown
+COMPRESS_RECORDINGS = False  # Save recordings as gzip-compressed .csv.gz files
+
+logger = logging.getLogger(__name__)
 
 class SerialReaderThread(QThread):
     """Thread for reading data from serial port without blocking UI"""
-    data_received = pyqtSignal(list)
+    data_received = pyqtSignal(object)  # (N, 7) array of samples
     connection_error = pyqtSignal(str)
     connection_status = pyqtSignal(bool)
     
@@ -42,121 +54,172 @@ class SerialReaderThread(QThread):
         self.port = port
         self.baud_rate = baud_rate
         self.serial_conn = None
-        self.running = False
+        self.running = True  # Cleared by stop(); set here so an early stop() is not lost
+        self.rx_buffer = bytearray()  # Received bytes not yet parsed into lines
+        
+        # The thread lives as long as the window and sleeps on this condition
+        # while no port is open, instead of being recreated per connection
+        self.mutex = QMutex()
+        self.wake_up = QWaitCondition()
+        self.requested_port = None  # Port the thread should open next
         
     def connect_to_device(self, port):
-        """Connect to the specified serial port"""
+        """Ask the thread to connect to the specified serial port"""
+        # Opening the port and waiting for the device happen on this thread,
+        # not the caller's; connection_status reports the outcome
+        self.mutex.lock()
+        self.requested_port = port
+        self.wake_up.wakeAll()
+        self.mutex.unlock()
+        
+    def open_port(self, port):
+        """Open the specified serial port (runs on the reader thread)"""
         try:
             # Close previous connection if exists
-            if self.serial_conn is not None:
-                if self.serial_conn.is_open:
-                    self.serial_conn.close()
-                self.serial_conn = None
+            self.disconnect_device()
                 
             # Create new connection
             self.port = port
-            self.serial_conn = serial.Serial(
+            serial_conn = serial.Serial(
                 port=port,
                 baudrate=self.baud_rate,
                 bytesize=serial.EIGHTBITS,
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE,
-                timeout=1
+                timeout=SERIAL_READ_TIMEOUT
             )
             
             # Flush any leftover data
-            self.serial_conn.reset_input_buffer()
-            self.serial_conn.reset_output_buffer()
+            serial_conn.reset_input_buffer()
+            serial_conn.reset_output_buffer()
+            self.rx_buffer.clear()
             
             # Wait for the serial connection to stabilize
             time.sleep(2.0)
             
+            # Hand the port to the reader loop
+            self.mutex.lock()
+            self.serial_conn = serial_conn
+            self.mutex.unlock()
+            
             # Signal successful connection
             self.connection_status.emit(True)
-            return True
         except Exception as e:
             self.connection_error.emit(f"Connection error: {str(e)}")
-            self.serial_conn = None
             self.connection_status.emit(False)
-            return False
+            
+    def disconnect_device(self):
+        """Close the serial port; the thread keeps running until the next connection"""
+        self.mutex.lock()
+        serial_conn, self.serial_conn = self.serial_conn, None
+        self.requested_port = None
+        self.mutex.unlock()
+        
+        try:
+            if serial_conn is not None and serial_conn.is_open:
+                # Wake a read blocked on this port before closing it
+                if hasattr(serial_conn, 'cancel_read'):
+                    serial_conn.cancel_read()
+                serial_conn.close()
+        except:
+            pass
             
     def run(self):
         """Main thread execution loop"""
-        self.running = True
-        debug_counter = 0  # For debugging
-        
         while self.running:
-            # Check if connection exists
-            if self.serial_conn is None:
-                time.sleep(0.1)
+            # Sleep until a port is open or requested (or the thread is stopped)
+            self.mutex.lock()
+            while self.running and self.serial_conn is None and self.requested_port is None:
+                self.wake_up.wait(self.mutex)
+            port, self.requested_port = self.requested_port, None
+            serial_conn = self.serial_conn
+            self.mutex.unlock()
+            if not self.running:
+                break
+            if port is not None:
+                self.open_port(port)
                 continue
                 
             try:
-                # Check if connection is open
-                if not self.serial_conn.is_open:
-                    time.sleep(0.1)
-                    continue
+                # Block until data arrives (or the read times out), then drain
+                # everything waiting in one read. A port closed under us raises
+                # here and is handled below, so is_open is not checked first
+                data = serial_conn.read(max(1, serial_conn.in_waiting))
+                if data:
+                    self.rx_buffer += data
+                    debug = logger.isEnabledFor(logging.DEBUG)  # Checked once per read
                     
-                # Read data if available
-                if self.serial_conn.in_waiting > 0:
-                    try:
-                        # Read one complete line
-                        line = self.serial_conn.readline().decode('utf-8').strip()
+                    # Walk the complete lines in place; the partial tail is kept for the next read
+                    lines = []
+                    start = 0
+                    end = self.rx_buffer.find(b'\n')
+                    while end >= 0:
+                        # bytes, not a bytearray view: NumPy would read a bytearray
+                        # field as a sequence of byte values instead of a number
+                        line = bytes(self.rx_buffer[start:end]).strip()
+                        start = end + 1
+                        end = self.rx_buffer.find(b'\n', start)
                         
-                        # Debug output every 50 lines
-                        debug_counter += 1
-                        if debug_counter % 50 == 0:
-                            print(f"Raw data received: {line}")
+                        if debug:
+                            logger.debug("Raw data received: %s", line)
                         
                         # Skip empty lines
                         if not line:
                             continue
                             
-                        # Parse data
-                        parts = [part.strip() for part in line.split(',')]
-                        if len(parts) == 7:
-                            try:
-                                data = [float(val) for val in parts]
-                                self.data_received.emit(data)
-                            except ValueError as ve:
-                                print(f"Value error parsing data: {ve} - Raw data: {line}")
-                                continue
+                        # Ensure we have all 7 expected values per line
+                        if line.count(b',') == 6:
+                            lines.append(line)
                         else:
-                            print(f"Expected 7 values but got {len(parts)} - Raw data: {line}")
-                    except UnicodeDecodeError:
-                        # Skip invalid UTF-8 data
-                        continue
-                else:
-                    # No data waiting, yield to other threads
-                    self.msleep(10)
+                            logger.warning("Expected 7 values but got %d - Raw data: %s", line.count(b',') + 1, line)
+                    del self.rx_buffer[:start]
+                    
+                    # One signal per read instead of one per sample
+                    batch = self.parse_lines(lines)
+                    if len(batch):
+                        self.data_received.emit(batch)
             except Exception as e:
+                # The port was closed or replaced by disconnect_device; not an error
+                if serial_conn is not self.serial_conn:
+                    continue
+                    
                 # Handle connection errors
                 error_message = str(e)
-                print(f"Serial error: {error_message}")
+                logger.error("Serial error: %s", error_message)
                 self.connection_error.emit(f"Read error: {error_message}")
                 
-                # Reset connection on error
-                try:
-                    if self.serial_conn is not None:
-                        self.serial_conn.close()
-                except:
-                    pass
-                self.serial_conn = None
+                # Reset connection on error; the loop then waits for a new one
+                self.disconnect_device()
                 self.connection_status.emit(False)
-                
-                # Wait before retry
-                time.sleep(1)
+    
+    def parse_lines(self, lines):
+        """Parse complete 'v1,...,v7' byte lines into an (N, 7) float array"""
+        if not lines:
+            return np.empty((0, 7))
+            
+        try:
+            # Convert every field of the batch in a single NumPy call
+            return np.array(b','.join(lines).split(b','), dtype=np.float64).reshape(-1, 7)
+        except ValueError:
+            # A garbled line somewhere in the batch; fall back to line by line and skip it
+            rows = []
+            for line in lines:
+                try:
+                    row = np.array(bytes(line).split(b','), dtype=np.float64)
+                except ValueError as ve:
+                    logger.warning("Value error parsing data: %s - Raw data: %s", ve, line)
+                    continue
+                if row.shape == (7,):
+                    rows.append(row)
+            return np.array(rows).reshape(-1, 7)
     
     def stop(self):
         """Stop the thread and close connection"""
+        self.mutex.lock()
         self.running = False
-        try:
-            if self.serial_conn is not None:
-                if self.serial_conn.is_open:
-                    self.serial_conn.close()
-                self.serial_conn = None
-        except:
-            pass
+        self.wake_up.wakeAll()
+        self.mutex.unlock()
+        self.disconnect_device()
         self.wait()
 
 
@@ -185,10 +248,14 @@ class AccelGyroPlot(FigureCanvas):
         super(AccelGyroPlot, self).__init__(self.fig)
         self.setParent(parent)
         
-        # Data buffers
-        self.times = deque(maxlen=SAMPLE_WINDOW)
-        self.accel_data = [deque(maxlen=SAMPLE_WINDOW) for _ in range(3)]
-        self.gyro_data = [deque(maxlen=SAMPLE_WINDOW) for _ in range(3)]
+        # Ring buffer with one row per channel (accel x/y/z, gyro x/y/z); head is
+        # the oldest column. Every column is written twice, SAMPLE_WINDOW apart,
+        # so the ordered window is the slice buffer[:, head:head + SAMPLE_WINDOW]
+        self.buffer = np.zeros((6, 2 * SAMPLE_WINDOW))
+        self.head = 0
+        
+        # Fixed x positions: the window scrolls through the data, not the axes
+        self.times = np.arange(SAMPLE_WINDOW)
         
         # Initialize line objects
         self.accel_lines = []
@@ -208,54 +275,65 @@ class AccelGyroPlot(FigureCanvas):
         self.accel_ax.legend(loc='upper right', fontsize='small')
         self.gyro_ax.legend(loc='upper right', fontsize='small')
         
-        # Start with some initial data to avoid issues
-        for i in range(SAMPLE_WINDOW):
-            self.times.append(i)
-            for j in range(3):
-                self.accel_data[j].append(0)
-                self.gyro_data[j].append(0)
-                
-        # Set y-axis limits
+        # Set axis limits
         self.accel_ax.set_ylim(-3, 3)
         self.gyro_ax.set_ylim(-3, 3)
+        self.accel_ax.set_xlim(0, SAMPLE_WINDOW - 1)
+        self.gyro_ax.set_xlim(0, SAMPLE_WINDOW - 1)
+        
+        # Lines are only drawn by blitting over the cached axes backgrounds.
+        # Set after the legends are built so their handles stay visible
+        for line in self.accel_lines + self.gyro_lines:
+            line.set_animated(True)
+        self.backgrounds = None
+        self.mpl_connect('draw_event', self.on_draw)
         
         # Initial draw
         self.update_plot()
     
-    def update_data(self, data):
-        """Add new data to the plot buffers"""
-        # Add new time point
-        if len(self.times) > 0:
-            self.times.append(self.times[-1] + 1)
-        else:
-            self.times.append(0)
-            
-        # Add accelerometer data (first 3 values)
-        for i in range(3):
-            self.accel_data[i].append(data[i])
-            
-        # Add gyroscope data (next 3 values)
-        for i in range(3):
-            self.gyro_data[i].append(data[i+3])
+    def on_draw(self, event):
+        """Cache the static axes backgrounds after a full redraw"""
+        self.backgrounds = [self.fig.canvas.copy_from_bbox(ax.bbox) for ax in (self.accel_ax, self.gyro_ax)]
+        for line in self.accel_lines:
+            self.accel_ax.draw_artist(line)
+        for line in self.gyro_lines:
+            self.gyro_ax.draw_artist(line)
+    
+    def update_data(self, batch):
+        """Add an (N, 7) batch of new data to the plot buffers"""
+        # Overwrite the oldest columns with the sensor values; samples older
+        # than the last SAMPLE_WINDOW would be overwritten anyway
+        recent = batch[-SAMPLE_WINDOW:]
+        skipped = len(batch) - len(recent)
+        columns = (self.head + skipped + np.arange(len(recent))) % SAMPLE_WINDOW
+        for offset in (0, SAMPLE_WINDOW):
+            self.buffer[:, columns + offset] = recent[:, :6].T
+        self.head = (self.head + len(batch)) % SAMPLE_WINDOW
             
     def update_plot(self):
         """Update the plot with current data"""
-        time_array = list(self.times)
-        
-        # Update x-axis limits to show the most recent data
-        self.accel_ax.set_xlim(max(0, time_array[-1] - SAMPLE_WINDOW), max(SAMPLE_WINDOW, time_array[-1]))
-        self.gyro_ax.set_xlim(max(0, time_array[-1] - SAMPLE_WINDOW), max(SAMPLE_WINDOW, time_array[-1]))
+        window = self.buffer[:, self.head:self.head + SAMPLE_WINDOW]
         
         # Update accelerometer lines
         for i, line in enumerate(self.accel_lines):
-            line.set_data(time_array, list(self.accel_data[i]))
+            line.set_data(self.times, window[i])
             
         # Update gyroscope lines
         for i, line in enumerate(self.gyro_lines):
-            line.set_data(time_array, list(self.gyro_data[i]))
+            line.set_data(self.times, window[i + 3])
             
-        # Redraw
-        self.fig.canvas.draw_idle()
+        # Nothing cached yet: full redraw, which caches the backgrounds
+        if self.backgrounds is None:
+            self.fig.canvas.draw_idle()
+            return
+        
+        # Otherwise repaint only the lines over the cached backgrounds
+        for ax, background, lines in zip((self.accel_ax, self.gyro_ax), self.backgrounds,
+                                         (self.accel_lines, self.gyro_lines)):
+            self.fig.canvas.restore_region(background)
+            for line in lines:
+                ax.draw_artist(line)
+            self.fig.canvas.blit(ax.bbox)
 
 
 class DataRecorder:
@@ -263,10 +341,19 @@ class DataRecorder:
     def __init__(self):
         self.recording = False
         self.current_alphabet = None
-        self.recorded_data = []
+        # Rows of timestamp, accel x/y/z, gyro x/y/z; only the first sample_count are valid
+        self.samples = np.empty((RECORDING_INITIAL_CAPACITY, 7))
+        self.sample_count = 0
         self.user_id = None
         self.hand_preference = None
         self.start_time = None
+        self.last_timestamp = 0.0  # Timestamp of the newest recorded sample
+        
+        # Saved recordings not yet committed, as (filename, commit message) pairs,
+        # and whether commits are waiting to be pushed; only used by the SaveWorker
+        self.pending_sync = []
+        self.unpushed = False
+        self.repo = None
         
     def start_recording(self, alphabet, user_id, hand_preference):
         """Start recording data for the specified alphabet"""
@@ -274,85 +361,159 @@ class DataRecorder:
         self.current_alphabet = alphabet
         self.user_id = user_id
         self.hand_preference = hand_preference
-        self.recorded_data = []
-        self.start_time = time.time()
+        # Fresh buffer, so a previous recording can still be saved from the old one
+        self.samples = np.empty((RECORDING_INITIAL_CAPACITY, 7))
+        self.sample_count = 0
+        self.start_time = time.perf_counter()  # Monotonic, so timestamps never step back
+        self.last_timestamp = 0.0
         return True
         
-    def add_data_point(self, data):
-        """Add a new data point to the current recording session"""
+    def add_data(self, batch):
+        """Add an (N, 7) batch of data points to the current recording session"""
         if not self.recording:
             return False
             
-        # Store timestamp and sensor values
-        self.recorded_data.append({
-            "timestamp": time.time() - self.start_time,
-            "user_id": self.user_id,
-            "hand_preference": self.hand_preference,
-            "accel_x": data[0],
-            "accel_y": data[1],
-            "accel_z": data[2],
-            "gyro_x": data[3], 
-            "gyro_y": data[4],
-            "gyro_z": data[5],
-            # Note: ignoring data[6] (x7) as per requirements
-        })
+        # Grow geometrically so appends stay amortized O(1)
+        end = self.sample_count + len(batch)
+        if end > len(self.samples):
+            grown = np.empty((max(2 * len(self.samples), end), 7))
+            grown[:self.sample_count] = self.samples[:self.sample_count]
+            self.samples = grown
+            
+        # A batch is everything that arrived since the previous one, so spread its
+        # timestamps evenly over that interval; keep them strictly increasing
+        # (1 us apart at least) even if the clock has not moved
+        now = max(time.perf_counter() - self.start_time, self.last_timestamp + 1e-6 * len(batch))
+        self.samples[self.sample_count:end, 0] = np.linspace(self.last_timestamp, now, len(batch) + 1)[1:]
+        self.last_timestamp = now
+        
+        # Store sensor values; user ID and hand preference are the same for the
+        # whole recording and are added when saving
+        self.samples[self.sample_count:end, 1:] = batch[:, :6]  # Note: ignoring data[6] (x7) as per requirements
+        self.sample_count = end
         return True
         
     def stop_recording(self):
         """Stop the current recording session"""
         self.recording = False
-        return len(self.recorded_data) > 0
+        return self.sample_count > 0
         
-    def save_recording(self):
-        """Save the recorded data to a file and sync with GitHub"""
-        if not self.current_alphabet or not self.recorded_data:
+    def take_recording(self):
+        """Return the finished recording's samples and metadata for saving"""
+        return self.samples[:self.sample_count], self.current_alphabet, self.user_id, self.hand_preference
+        
+    def save_recording(self, samples, alphabet, user_id, hand_preference):
+        """Save the recorded data to a file and queue it for GitHub sync"""
+        if not alphabet or not len(samples):
             return False, "No data to save"
             
         # Create directory for the alphabet if it doesn't exist
-        alphabet_dir = os.path.join(DATA_DIR, self.current_alphabet)
+        alphabet_dir = os.path.join(DATA_DIR, alphabet)
         os.makedirs(alphabet_dir, exist_ok=True)
         
         # Create a unique filename with timestamp
         timestamp = time.strftime("%Y%m%d_%H%M%S")
-        filename = os.path.join(alphabet_dir, f"{self.current_alphabet}_{self.user_id}_{self.hand_preference}_{timestamp}.csv")
+        filename = os.path.join(alphabet_dir, f"{alphabet}_{user_id}_{hand_preference}_{timestamp}.csv")
+        if COMPRESS_RECORDINGS:
+            filename += '.gz'
         
         # Save the data to CSV file
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                # Write header
-                writer.writerow(['timestamp', 'user_id', 'hand_preference', 'acc_x', 'acc_y', 'acc_z', 'gyro_x', 'gyro_y', 'gyro_z'])
+            # User ID and hand preference are the same on every row, so they
+            # are baked into the row format and the whole array is written in one call
+            header = 'timestamp,user_id,hand_preference,acc_x,acc_y,acc_z,gyro_x,gyro_y,gyro_z'
+            constants = f"{user_id},{hand_preference}".replace('%', '%%')
+            row_format = '%.6f,' + constants + ',%.6g,%.6g,%.6g,%.6g,%.6g,%.6g'
+            if COMPRESS_RECORDINGS:
+                csvfile = gzip.open(filename, 'wt', compresslevel=3, newline='', encoding='utf-8')
+            else:
+                csvfile = open(filename, 'w', newline='', encoding='utf-8')
+            with csvfile:
+                np.savetxt(csvfile, samples, fmt=row_format, header=header, comments='')
+        except Exception as e:
+            return False, str(e)
+        
+        self.pending_sync.append((filename, f"Added recording: {alphabet} by user {user_id} ({hand_preference})"))
+        return True, filename
+        
+    def sync_with_github(self):
+        """Commit all pending recordings at once and push them to GitHub"""
+        batch, self.pending_sync = self.pending_sync, []
+        if not batch and not self.unpushed:
+            return True, "Nothing to sync"
+            
+        try:
+            if self.repo is None:
+                self.repo = git.Repo(GITHUB_REPO_PATH)
                 
-                # Write data rows
-                for row in self.recorded_data:
-                    writer.writerow([
-                        row['timestamp'],
-                        row['user_id'],
-                        row['hand_preference'],
-                        row['accel_x'],
-                        row['accel_y'],
-                        row['accel_z'],
-                        row['gyro_x'],
-                        row['gyro_y'],
-                        row['gyro_z']
-                    ])
+            if batch:
+                self.repo.git.add(*[os.path.relpath(filename, GITHUB_REPO_PATH) for filename, _ in batch])
+                messages = [message for _, message in batch]
+                if len(messages) == 1:
+                    self.repo.git.commit('-m', messages[0])
+                else:
+                    self.repo.git.commit('-m', f"Added {len(messages)} recordings", '-m', "\n".join(messages))
+                self.unpushed = True
+        except Exception as e:
+            # Keep the recordings queued for the next attempt
+            self.pending_sync[:0] = batch
+            return False, f"GitHub sync error: {str(e)}"
             
-            # Sync with GitHub
+        try:
+            origin = self.repo.remote(name='origin')
+            origin.push()
+            self.unpushed = False
+            return True, f"Synced {len(batch)} recordings"
+        except Exception as e:
+            return False, f"GitHub sync error: {str(e)}"
+
+
+class SaveWorker(QThread):
+    """Thread for saving recordings and syncing with GitHub without blocking UI"""
+    save_finished = pyqtSignal(bool, str)
+    sync_failed = pyqtSignal(str)
+    
+    def __init__(self, data_recorder):
+        super().__init__()
+        self.data_recorder = data_recorder
+        self.jobs = queue.Queue()  # take_recording() tuples; None stops the thread
+        self.sync_deadline = None  # When the oldest pending recording must be synced
+        
+    def run(self):
+        """Save queued recordings one at a time and sync them with GitHub in batches"""
+        while True:
+            # Wait for the next recording, but no longer than the sync deadline
+            timeout = None
+            if self.data_recorder.pending_sync or self.data_recorder.unpushed:
+                timeout = max(0, self.sync_deadline - time.time())
             try:
-                repo = git.Repo(GITHUB_REPO_PATH)
-                relative_path = os.path.relpath(filename, GITHUB_REPO_PATH)
-                repo.git.add(relative_path)
-                commit_message = f"Added recording: {self.current_alphabet} by user {self.user_id} ({self.hand_preference})"
-                repo.git.commit('-m', commit_message)
-                origin = repo.remote(name='origin')
-                origin.push()
+                job = self.jobs.get(timeout=timeout)
+            except queue.Empty:
+                self.sync()
+                continue
                 
-                return True, filename
-            except Exception as e:
-                return False, f"GitHub sync error: {str(e)}"
+            if job is None:
+                self.sync()
+                break
                 
-        except Exception as e:
-            return False, str(e)
+            success, result = self.data_recorder.save_recording(*job)
+            self.save_finished.emit(success, result)
+            if success and len(self.data_recorder.pending_sync) == 1 and not self.data_recorder.unpushed:
+                self.sync_deadline = time.time() + GIT_SYNC_INTERVAL
+            if len(self.data_recorder.pending_sync) >= GIT_SYNC_BATCH_SIZE:
+                self.sync()
+                
+    def sync(self):
+        """Sync pending recordings, retrying after GIT_SYNC_INTERVAL on failure"""
+        success, result = self.data_recorder.sync_with_github()
+        self.sync_deadline = time.time() + GIT_SYNC_INTERVAL
+        if not success:
+            self.sync_failed.emit(result)
+            
+    def stop(self):
+        """Finish the queued saves, then stop the thread"""
+        self.jobs.put(None)
+        self.wait()
 
 
 class UserManager:
@@ -366,7 +527,11 @@ class UserManager:
         """Load existing users from file"""
         os.makedirs(DATA_DIR, exist_ok=True)
         
-        if os.path.exists(self.users_file):
+        # Write the header up front, so registering a user only appends a row
+        if not os.path.exists(self.users_file) or os.path.getsize(self.users_file) == 0:
+            with open(self.users_file, 'w', newline='', encoding='utf-8') as csvfile:
+                csv.writer(csvfile).writerow(['user_id', 'username'])
+        else:
             with open(self.users_file, 'r', encoding='utf-8') as csvfile:
                 reader = csv.reader(csvfile)
                 next(reader, None)  # Skip header
@@ -386,10 +551,7 @@ class UserManager:
         
         # Save to file
         with open(self.users_file, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            if os.path.getsize(self.users_file) == 0:
-                writer.writerow(['user_id', 'username'])
-            writer.writerow([user_id, username])
+            csv.writer(csvfile).writerow([user_id, username])
         
         return user_id
     
@@ -411,18 +573,30 @@ class AirWritingSystem(QMainWindow):
         self.serial_reader = SerialReaderThread()
         self.serial_reader.data_received.connect(self.process_serial_data)
         self.serial_reader.connection_error.connect(self.show_error_message)
+        self.serial_reader.connection_status.connect(self.update_connection_status)
         
         # Initialize data recorder and user manager
         self.data_recorder = DataRecorder()
         self.user_manager = UserManager()
         
+        # Recordings are saved and synced on a background thread
+        self.save_worker = SaveWorker(self.data_recorder)
+        self.save_worker.save_finished.connect(self.save_finished)
+        self.save_worker.sync_failed.connect(self.report_sync_error)
+        self.save_worker.start()
+        
+        # Samples waiting to be plotted, and the plot redraw rate in UI ticks
+        self.pending_samples = []
+        self.tick = 0
+        self.display_skip = DEFAULT_DISPLAY_SKIP
+        
         # Set up the UI
         self.setup_ui()
         
         # Start the UI update timer
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_ui)
-        self.update_timer.start(50)  # 20 Hz refresh rate
+        self.update_timer.start(UI_UPDATE_INTERVAL)
         
         # Start the serial reader thread
         self.serial_reader.start()
@@ -541,6 +715,14 @@ class AirWritingSystem(QMainWindow):
         refresh_button = QPushButton("Refresh")
         refresh_button.clicked.connect(self.refresh_serial_ports)
         
+        # Plot refresh rate
+        refresh_rate_label = QLabel("Plot Refresh:")
+        self.refresh_rate_combo = QComboBox()
+        for skip in DISPLAY_SKIP_OPTIONS:
+            self.refresh_rate_combo.addItem(f"{1000 / (UI_UPDATE_INTERVAL * skip):.0f} Hz", skip)
+        self.refresh_rate_combo.setCurrentIndex(DISPLAY_SKIP_OPTIONS.index(DEFAULT_DISPLAY_SKIP))
+        self.refresh_rate_combo.currentIndexChanged.connect(self.change_refresh_rate)
+        
         # Connection status
         self.connection_status = QLabel("Disconnected")
         self.connection_status.setStyleSheet("color: #E74C3C; font-weight: bold;")
@@ -550,6 +732,8 @@ class AirWritingSystem(QMainWindow):
         layout.addWidget(self.port_combo)
         layout.addWidget(self.connect_button)
         layout.addWidget(refresh_button)
+        layout.addWidget(refresh_rate_label)
+        layout.addWidget(self.refresh_rate_combo)
         layout.addStretch()
         layout.addWidget(QLabel("Status:"))
         layout.addWidget(self.connection_status)
@@ -657,34 +841,38 @@ class AirWritingSystem(QMainWindow):
     def toggle_connection(self):
         """Connect to or disconnect from the selected serial port"""
         if self.serial_reader.serial_conn is not None and self.serial_reader.serial_conn.is_open:
-            # Disconnect
-            self.serial_reader.stop()
-            self.serial_reader = SerialReaderThread()  # Create new thread instance
-            self.serial_reader.data_received.connect(self.process_serial_data)
-            self.serial_reader.connection_error.connect(self.show_error_message)
-            self.serial_reader.start()
-            
-            self.connect_button.setText("Connect")
-            self.connection_status.setText("Disconnected")
-            self.connection_status.setStyleSheet("color: #E74C3C; font-weight: bold;")
+            # Disconnect; the reader thread stays alive for the next connection
+            self.serial_reader.disconnect_device()
+            self.update_connection_status(False)
             self.status_bar.showMessage("Device disconnected")
-            self.start_button.setEnabled(False)
         else:
-            # Connect
+            # Connect; the reader thread opens the port and reports back through
+            # connection_status, so the UI stays responsive while the device settles
             port = self.port_combo.currentText()
             if port:
-                if self.serial_reader.connect_to_device(port):
-                    self.connect_button.setText("Disconnect")
-                    self.connection_status.setText("Connected")
-                    self.connection_status.setStyleSheet("color: #2ECC71; font-weight: bold;")
-                    self.status_bar.showMessage(f"Connected to {port}")
-                    if self.user_id_display.text() != "Not registered":
-                        self.start_button.setEnabled(True)
-                else:
-                    self.status_bar.showMessage(f"Failed to connect to {port}")
+                self.serial_reader.connect_to_device(port)
+                self.connect_button.setEnabled(False)
+                self.connection_status.setText("Connecting...")
+                self.status_bar.showMessage(f"Connecting to {port}...")
             else:
                 self.status_bar.showMessage("No port selected")
     
+    def update_connection_status(self, connected):
+        """Update the connection controls when the device connects or disconnects"""
+        self.connect_button.setEnabled(self.port_combo.count() > 0)
+        if connected:
+            self.connect_button.setText("Disconnect")
+            self.connection_status.setText("Connected")
+            self.connection_status.setStyleSheet("color: #2ECC71; font-weight: bold;")
+            self.status_bar.showMessage(f"Connected to {self.serial_reader.port}")
+            if self.user_id_display.text() != "Not registered":
+                self.start_button.setEnabled(True)
+        else:
+            self.connect_button.setText("Connect")
+            self.connection_status.setText("Disconnected")
+            self.connection_status.setStyleSheet("color: #E74C3C; font-weight: bold;")
+            self.start_button.setEnabled(False)
+    
     def register_user(self):
         """Register a new user or get existing user ID"""
         username = self.username_input.text().strip()
@@ -702,29 +890,38 @@ class AirWritingSystem(QMainWindow):
             
         self.status_bar.showMessage(f"User registered: {username} (ID: {user_id})")
     
-    def process_serial_data(self, data):
-        """Process data received from the serial port"""
-        # Update the plot with new data
-        self.plot_canvas.update_data(data)
+    def process_serial_data(self, batch):
+        """Process a batch of samples received from the serial port"""
+        # Queue the samples for the plot; they are handed over on the next redraw
+        self.pending_samples.append(batch)
         
         # If recording, add data to recording
         if self.data_recorder.recording:
-            self.data_recorder.add_data_point(data)
-            
-            # Update data count label
-            self.data_count_label.setText(f"Data points: {len(self.data_recorder.recorded_data)}")
+            self.data_recorder.add_data(batch)
     
     def update_ui(self):
         """Update the UI elements"""
-        # Update the plot
-        self.plot_canvas.update_plot()
+        # Connection changes arrive through update_connection_status, so the
+        # port is not polled here
         
-        # Check if serial connection is still active
-        if self.serial_reader.serial_conn and not self.serial_reader.serial_conn.is_open:
-            self.connection_status.setText("Disconnected")
-            self.connection_status.setStyleSheet("color: #E74C3C; font-weight: bold;")
-            self.connect_button.setText("Connect")
-            self.start_button.setEnabled(False)
+        # Update data count label once per tick rather than per batch
+        if self.data_recorder.recording:
+            self.data_count_label.setText(f"Data points: {self.data_recorder.sample_count}")
+        
+        # Only redraw the plot every display_skip ticks, and only if new samples arrived
+        self.tick += 1
+        if self.tick % self.display_skip or not self.pending_samples:
+            return
+        
+        # Move the queued samples into the plot buffers in one go, then redraw
+        for batch in self.pending_samples:
+            self.plot_canvas.update_data(batch)
+        self.pending_samples = []
+        self.plot_canvas.update_plot()
+    
+    def change_refresh_rate(self, index):
+        """Set how many UI ticks pass between plot redraws"""
+        self.display_skip = self.refresh_rate_combo.itemData(index)
     
     def start_recording(self):
         """Start recording data for the selected alphabet"""
@@ -776,7 +973,7 @@ class AirWritingSystem(QMainWindow):
             msg_box.setIcon(QMessageBox.Question)
             msg_box.setWindowTitle("Save Recording")
             msg_box.setText(f"Save recording for alphabet '{self.data_recorder.current_alphabet}'?")
-            msg_box.setInformativeText(f"Contains {len(self.data_recorder.recorded_data)} data points.")
+            msg_box.setInformativeText(f"Contains {self.data_recorder.sample_count} data points.")
             msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
             msg_box.setDefaultButton(QMessageBox.Yes)
             
@@ -786,14 +983,21 @@ class AirWritingSystem(QMainWindow):
                 self.status_bar.showMessage("Recording discarded")
     
     def save_recording(self):
-        """Save the current recording session"""
-        success, result = self.data_recorder.save_recording()
+        """Queue the current recording session for saving"""
+        self.save_worker.jobs.put(self.data_recorder.take_recording())
+        self.status_bar.showMessage("Saving recording...")
         
+    def save_finished(self, success, result):
+        """Report the outcome of a background save"""
         if success:
-            self.status_bar.showMessage(f"Recording saved and synced: {result}")
-            QMessageBox.information(self, "Success", "Data saved and synchronized with GitHub")
+            self.status_bar.showMessage(f"Recording saved: {result}")
+            QMessageBox.information(self, "Success", "Data saved; it will be synchronized with GitHub shortly")
         else:
             self.show_error_message(f"Failed to save recording: {result}")
+            
+    def report_sync_error(self, message):
+        """Show a failed GitHub sync; it is retried automatically"""
+        self.status_bar.showMessage(f"{message} (will retry)")
     
     def show_error_message(self, message):
         """Show an error message to the user"""
@@ -811,6 +1015,9 @@ class AirWritingSystem(QMainWindow):
         if self.serial_reader.isRunning():
             self.serial_reader.stop()
             
+        # Let queued recordings finish saving
+        self.save_worker.stop()
+            
         # Accept the close event
         event.accept()
 
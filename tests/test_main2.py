@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+for module in ("PyQt5", "serial", "git", "matplotlib"):
+    pytest.importorskip(module)
+
+from main2 import DataRecorder, SerialReaderThread
+
+
+def parse(lines):
+    # parse_lines does not touch thread state, so no QThread is needed
+    return SerialReaderThread.parse_lines(None, lines)
+
+
+def test_parse_lines_bulk():
+    lines = [bytearray(b"1.5,2,3,4,5,6,7"), bytearray(b"-1, 0.25,3,4,5,6,70")]
+    np.testing.assert_array_equal(
+        parse(lines), [[1.5, 2, 3, 4, 5, 6, 7], [-1, 0.25, 3, 4, 5, 6, 70]]
+    )
+
+
+def test_parse_lines_skips_garbled_line_in_batch():
+    lines = [
+        bytearray(b"10.5,20.25,30,40,50,60,70"),
+        bytearray(b"11.5,2x.25,31,41,51,61,71"),
+        bytearray(b"12.5,22.25,32,42,52,62,72"),
+    ]
+    np.testing.assert_array_equal(
+        parse(lines), [[10.5, 20.25, 30, 40, 50, 60, 70], [12.5, 22.25, 32, 42, 52, 62, 72]]
+    )
+
+
+def test_parse_lines_single_character_fields_are_not_byte_values():
+    lines = [bytearray(b"1,2,3,4,5,6,7"), bytearray(b"1,2,x,4,5,6,7")]
+    np.testing.assert_array_equal(parse(lines), [[1, 2, 3, 4, 5, 6, 7]])
+
+
+def test_parse_lines_empty():
+    assert parse([]).shape == (0, 7)
+
+
+def test_add_data_spreads_timestamps_across_batches():
+    recorder = DataRecorder()
+    recorder.start_recording("অ", "user", "Right Hand")
+    for _ in range(3):
+        recorder.add_data(np.ones((5, 7)))
+    timestamps = recorder.samples[:recorder.sample_count, 0]
+    assert len(timestamps) == 15
+    assert np.all(np.diff(timestamps) > 0)